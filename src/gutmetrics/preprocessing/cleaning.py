@@ -9,6 +9,19 @@ import pandas as pd
 if TYPE_CHECKING:
     from numpy.typing import NDArray
 
+# Default columns required by the validators. The metabolomics columns stay
+# ordered so error messages list them deterministically.
+_REQUIRED_META_COLS = ("shannon", "PD_whole_tree", "chao1")
+
+# Example required columns
+_REQUIRED_MICRO_COLS = frozenset({"bacteria_1", "bacteria_2", "total_reads"})
+
+# Rows per chunk when summing OTU abundances in validate_microbiome_data
+_VALIDATION_CHUNK_SIZE = 10_000
+
+# Tolerance of np.allclose(x, 1.0) with default rtol=1e-5 and atol=1e-8
+_NORMALIZATION_TOL = 1e-8 + 1e-5 * 1.0
+
 
 def standardize_index(
     df: pd.DataFrame,
@@ -37,15 +50,16 @@ def standardize_index(
         raise ValueError(msg)
 
     # Check for duplicate IDs
-    if df[index_col].duplicated().any():
+    if not df[index_col].is_unique:
         msg = "Duplicate client IDs found"
         raise ValueError(msg)
 
-    df_copy = df.copy()
-    if df_copy.index.name != index_col and index_col in df_copy.columns:
-        df_copy = df_copy.set_index(index_col)
-    df_copy.index = df_copy.index.astype(index_type)
-    return df_copy
+    # set_index already returns a new frame, so no defensive copy is needed;
+    # only the index array is reallocated by the cast
+    out = df
+    if df.index.name != index_col and index_col in df.columns:
+        out = df.set_index(index_col)
+    return out.set_axis(out.index.astype(index_type), axis=0, copy=False)
 
 
 def remove_outliers(
@@ -61,14 +75,28 @@ def remove_outliers(
     Returns:
         DataFrame with outliers removed
     """
-    q1 = data[column].quantile(0.25)
-    q3 = data[column].quantile(0.75)
+    values = data[column].to_numpy(dtype=np.float64)
+    # No bounds can be computed, and every row would fail the comparison
+    if np.isnan(values).all():
+        return data.iloc[:0]
+
+    # Single partition for both quartiles; NaNs are skipped like Series.quantile
+    q1, q3 = np.nanquantile(values, [0.25, 0.75])
     iqr = q3 - q1
 
     lower_bound = q1 - n_std * iqr
     upper_bound = q3 + n_std * iqr
 
-    return data[(data[column] >= lower_bound) & (data[column] <= upper_bound)]
+    # Fused into one pass by numexpr when it is installed
+    mask = pd.eval(
+        "(values >= lower_bound) & (values <= upper_bound)",
+        local_dict={
+            "values": values,
+            "lower_bound": lower_bound,
+            "upper_bound": upper_bound,
+        },
+    )
+    return data.iloc[mask]
 
 
 def validate_metabolomics_data(
@@ -96,7 +124,7 @@ def validate_metabolomics_data(
         raise ValueError(msg)
 
     if required_cols is None:
-        required_cols = ["shannon", "PD_whole_tree", "chao1"]
+        required_cols = _REQUIRED_META_COLS
 
     # Check required columns exist
     missing_cols = [col for col in required_cols if col not in df.columns]
@@ -105,10 +133,9 @@ def validate_metabolomics_data(
         raise ValueError(msg)
 
     # Check for all numeric data in metabolite columns
-    metabolite_cols = [col for col in df.columns if col not in required_cols]
-    non_numeric = (
-        df[metabolite_cols].select_dtypes(exclude=["float64", "int64"]).columns
-    )
+    metabolite_cols = df.columns.difference(required_cols, sort=False)
+    numeric_cols = df.select_dtypes(include=np.number).columns
+    non_numeric = metabolite_cols.difference(numeric_cols, sort=False)
     if len(non_numeric) > 0:
         msg = f"Non-numeric data found in columns: {', '.join(non_numeric)}"
         raise ValueError(msg)
@@ -116,6 +143,33 @@ def validate_metabolomics_data(
     return True
 
 
+def _otu_column_mask(columns: pd.Index) -> "NDArray[np.bool_]":
+    """Flag bacterial OTU columns, i.e. names containing "bacteria" in any case.
+
+    Uses Arrow's vectorized string kernels when pyarrow is installed and a
+    single case-insensitive pass of pandas' string methods otherwise.
+
+    Args:
+    ----
+        columns: Column labels to check
+
+    Returns:
+    -------
+        Boolean mask over ``columns``
+
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.compute as pc
+    except ImportError:
+        matches = columns.astype(str).str.contains("bacteria", case=False, regex=False)
+        return np.asarray(matches, dtype=np.bool_)
+
+    names = pa.array(columns.astype(str))
+    matches = pc.match_substring(names, "bacteria", ignore_case=True)
+    return np.asarray(matches.to_numpy(zero_copy_only=False), dtype=np.bool_)
+
+
 def validate_microbiome_data(df: pd.DataFrame, min_reads: int = 30000) -> bool:
     """Validate microbiome data format and content.
 
@@ -138,7 +192,8 @@ def validate_microbiome_data(df: pd.DataFrame, min_reads: int = 30000) -> bool:
         raise ValueError(msg)
 
     # Check for OTU columns
-    if not any("bacteria" in col.lower() for col in df.columns):
+    otu_mask = _otu_column_mask(df.columns)
+    if not otu_mask.any():
         msg = "No bacterial OTU columns found"
         raise ValueError(msg)
 
@@ -149,14 +204,19 @@ def validate_microbiome_data(df: pd.DataFrame, min_reads: int = 30000) -> bool:
             msg = f"Samples {low_reads} have fewer than {min_reads} reads"
             raise ValueError(msg)
 
-    # Check for normalized values
-    otu_cols = [col for col in df.columns if "bacteria" in col.lower()]
-    if TYPE_CHECKING:
-        sums: NDArray[np.float64] = df[otu_cols].sum(axis=1).to_numpy()
-    else:
-        sums = df[otu_cols].sum(axis=1).to_numpy()
-
-    if not np.allclose(sums, 1.0):
+    # Check for normalized values in row chunks so that only one chunk of the
+    # OTU sub-frame is materialized at a time. Missing abundances are skipped,
+    # as DataFrame.sum does.
+    otu_positions = np.flatnonzero(otu_mask)
+    sums: NDArray[np.float64] = np.empty(len(df), dtype=np.float64)
+    for start in range(0, len(df), _VALIDATION_CHUNK_SIZE):
+        stop = start + _VALIDATION_CHUNK_SIZE
+        block = df.iloc[start:stop, otu_positions].to_numpy(dtype=np.float64)
+        np.nansum(block, axis=1, out=sums[start:stop])
+
+    np.subtract(sums, 1.0, out=sums)
+    np.abs(sums, out=sums)
+    if sums.max() > _NORMALIZATION_TOL:
         msg = "OTU abundances are not normalized to sum to 1"
         raise ValueError(msg)
 
@@ -178,12 +238,7 @@ def clean_metadata(df: pd.DataFrame) -> pd.DataFrame:
     ------
         ValueError: If required columns are missing
     """
-    required_cols = [
-        "bacteria_1",
-        "bacteria_2",
-        "total_reads",
-    ]  # Example required columns
-    missing = [col for col in required_cols if col not in df.columns]
+    missing = _REQUIRED_MICRO_COLS.difference(df.columns)
     if missing:
         msg = "Missing required columns"
         raise ValueError(msg)
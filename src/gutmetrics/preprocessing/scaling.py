@@ -1,22 +1,438 @@
 """Module for scaling and normalizing data."""
 
+import functools
+import weakref
+import zlib
+from collections.abc import Callable
+from typing import TYPE_CHECKING
+
+import numpy as np
 import pandas as pd
 from sklearn.preprocessing import StandardScaler
 
+if TYPE_CHECKING:
+    from numpy.typing import DTypeLike, NDArray
+
+    # Column means and standard deviations keyed by (id(frame), feature columns),
+    # stored with a weak reference to the frame they were fitted on and a
+    # fingerprint of its feature block
+    StatsCache = dict[
+        tuple[int, tuple[str, ...]],
+        tuple[
+            weakref.ref[pd.DataFrame],
+            tuple[tuple[int, ...], int],
+            NDArray[np.float64],
+            NDArray[np.float64],
+        ],
+    ]
+
+# Blocks smaller than this are scaled with NumPy; JIT dispatch and thread
+# start-up only pay off on large feature blocks
+_NUMBA_MIN_SIZE = 1_000_000
+
+# Metadata columns inserted one by one around a scaled feature block; each
+# becomes its own block, and pandas warns about frames with over 100 blocks
+_MAX_INSERTED_COLUMNS = 50
+
+
+@functools.cache
+def _load_numba_kernel() -> Callable[["NDArray[np.floating]"], None] | None:
+    """Import the parallel standardization kernel if numba is installed.
+
+    Returns:
+    -------
+        The compiled kernel, or None when numba is unavailable
+
+    """
+    try:
+        from gutmetrics.preprocessing._kernels import standardize_inplace
+    except ImportError:
+        return None
+    return standardize_inplace
+
+
+def _standardize_inplace(arr: "NDArray[np.floating]") -> None:
+    """Standardize each column of a 2-D array to zero mean and unit variance.
+
+    Equivalent to ``StandardScaler().fit_transform`` (population standard
+    deviation, NaNs ignored when fitting and kept in the output, near
+    constant columns left unscaled) but without sklearn's input validation
+    copies. Large blocks are scaled column-parallel with numba when it is
+    installed.
+
+    Args:
+    ----
+        arr: Array of shape (n_samples, n_features), modified in place
+
+    """
+    if arr.size >= _NUMBA_MIN_SIZE:
+        kernel = _load_numba_kernel()
+        if kernel is not None:
+            kernel(arr)
+            return
+
+    _apply_stats(arr, *_fit_stats(arr))
+
+
+def _fit_stats(
+    arr: "NDArray[np.floating]",
+) -> tuple["NDArray[np.float64]", "NDArray[np.float64]"]:
+    """Compute the column means and standard deviations used for scaling.
+
+    Args:
+    ----
+        arr: Array of shape (n_samples, n_features)
+
+    Returns:
+    -------
+        Column means and standard deviations, with the deviations of near
+        constant columns set to 1
+
+    """
+    mean = np.nanmean(arr, axis=0, dtype=np.float64)
+    var = np.nanvar(arr, axis=0, dtype=np.float64)
+    n_samples = np.count_nonzero(~np.isnan(arr), axis=0)
+
+    # Same bound as sklearn's _is_constant_feature: variances within the
+    # rounding error of the two-pass algorithm count as zero
+    eps = np.finfo(np.float64).eps
+    constant = var <= n_samples * eps * var + (n_samples * mean * eps) ** 2
+
+    std = np.sqrt(var)
+    std[constant] = 1.0
+    return mean, std
+
+
+def _apply_stats(
+    arr: "NDArray[np.floating]",
+    mean: "NDArray[np.float64]",
+    std: "NDArray[np.float64]",
+) -> None:
+    """Center and scale the columns of ``arr`` in place.
+
+    Args:
+    ----
+        arr: Array of shape (n_samples, n_features), modified in place
+        mean: Column means
+        std: Column standard deviations
+
+    """
+    np.subtract(arr, mean, out=arr, casting="unsafe")
+    np.divide(arr, std, out=arr, casting="unsafe")
+
+
+def _block_fingerprint(
+    arr: "NDArray[np.floating]",
+) -> tuple[tuple[int, ...], int]:
+    """Summarize a feature block so cached statistics can be validated.
+
+    Args:
+    ----
+        arr: Array of shape (n_samples, n_features)
+
+    Returns:
+    -------
+        Shape of the array and a CRC32 checksum of its values
+
+    """
+    # Blocks taken from pandas are usually transposed views; checksum them
+    # in their memory order rather than copying them into C order
+    contiguous = np.ascontiguousarray(arr.T if arr.flags.f_contiguous else arr)
+    return arr.shape, zlib.crc32(contiguous.data)
+
+
+def _prune_stats_cache(cache: "StatsCache") -> None:
+    """Drop cached statistics of frames that have been garbage collected.
+
+    Args:
+    ----
+        cache: Cache to prune in place
+
+    """
+    dead_keys = [key for key, entry in cache.items() if entry[0]() is None]
+    for key in dead_keys:
+        del cache[key]
+
+
+def _copy_on_write_enabled() -> bool:
+    """Check whether pandas' copy-on-write mode is active.
+
+    Returns:
+    -------
+        True if shallow copies are protected from writes through either frame
+
+    """
+    return pd.options.mode.copy_on_write is True
+
+
+def _feature_block_view(
+    data: pd.DataFrame,
+    feature_cols: list[str],
+    dtype: "DTypeLike",
+) -> "NDArray[np.floating] | None":
+    """Find the feature columns as a writable view into pandas' storage block.
+
+    Pandas keeps same-dtype columns together in 2-D blocks. This relies on
+    the private BlockManager layout of pandas 2.x, so any other version, an
+    unexpected layout or an error while inspecting it yields None and the
+    caller falls back to the copying path.
+
+    Args:
+    ----
+        data: DataFrame holding the feature columns
+        feature_cols: Feature columns to look up
+        dtype: Required dtype of the feature block
+
+    Returns:
+    -------
+        View of shape (n_samples, n_features), or None if the columns are
+        not one contiguous run of a single block that only ``data`` owns
+
+    """
+    if not pd.__version__.startswith("2.") or not data.columns.is_unique:
+        return None
+
+    try:
+        mgr = data._mgr
+        positions = data.columns.get_indexer(feature_cols)
+        blknos = np.unique(mgr.blknos[positions])
+        if len(blknos) != 1:
+            return None
+        block = mgr.blocks[blknos[0]]
+        # Another pandas object still shares this block
+        if block.refs.has_reference():
+            return None
+        values = block.values
+        blklocs = np.sort(mgr.blklocs[positions])
+        block_positions = np.sort(block.mgr_locs.as_array[blklocs])
+    except Exception:
+        # Private pandas API: any failure means the layout is not understood
+        return None
+
+    # The block must be a plain array that pandas allocated itself: a frame
+    # built from a caller's ndarray wraps that array, which must not change
+    if (
+        not isinstance(values, np.ndarray)
+        or values.base is not None
+        or values.ndim != 2
+        or values.shape[1] != len(data)
+        or values.dtype != np.dtype(dtype)
+        or not values.flags.writeable
+    ):
+        return None
+
+    start, stop = blklocs[0], blklocs[-1] + 1
+    if stop - start != len(blklocs):
+        return None
+    # Cross-check the block's own column mapping against the frame's
+    if not np.array_equal(block_positions, np.sort(positions)):
+        return None
+
+    # Blocks are stored transposed as (n_columns, n_samples)
+    return values[start:stop].T
+
+
+def _scale_inplace_fast(
+    data: pd.DataFrame,
+    feature_cols: list[str],
+    dtype: "DTypeLike",
+) -> bool:
+    """Standardize feature columns directly inside pandas' storage block.
+
+    When :func:`_feature_block_view` finds the feature columns in a block
+    owned by ``data``, that block is scaled in place and the
+    ``data[feature_cols]`` copy is skipped entirely.
+
+    Args:
+    ----
+        data: DataFrame to modify in place
+        feature_cols: Feature columns to standardize
+        dtype: Required dtype of the feature block
+
+    Returns:
+    -------
+        True if the columns were scaled, False if the caller must fall back
+        to the copying path
+
+    """
+    view = _feature_block_view(data, feature_cols, dtype)
+    if view is None:
+        return False
+    _standardize_inplace(view)
+    return True
+
+
+def _combine_in_column_order(
+    data: pd.DataFrame,
+    feature_block: "NDArray[np.floating]",
+    feature_cols: list[str],
+) -> pd.DataFrame:
+    """Rebuild ``data`` with its feature columns taken from ``feature_block``.
+
+    The metadata columns are copied and inserted around the feature block at
+    their original positions, so the result keeps ``feature_block`` as its
+    storage. Concatenating would consolidate it with other float columns,
+    copying it again. Frames with many metadata columns are concatenated in
+    order instead, which avoids a fragmented result.
+
+    Args:
+    ----
+        data: DataFrame providing the metadata columns and column order
+        feature_block: Scaled feature columns, in the order they appear in
+            ``data``
+        feature_cols: Names of the feature columns
+
+    Returns:
+    -------
+        New DataFrame with the columns of ``data`` in their original order
+
+    """
+    is_feature = data.columns.isin(feature_cols)
+    metadata_positions = np.flatnonzero(~is_feature)
+    if len(metadata_positions) <= _MAX_INSERTED_COLUMNS:
+        combined = pd.DataFrame(
+            feature_block,
+            columns=data.columns[is_feature],
+            index=data.index,
+            copy=False,
+        )
+        for position in metadata_positions:
+            # insert copies the column values into a new block
+            combined.insert(
+                int(position),
+                data.columns[position],
+                data.iloc[:, position],
+                allow_duplicates=True,
+            )
+        return combined
+
+    bounds = np.flatnonzero(np.diff(is_feature)) + 1
+    starts = np.concatenate(([0], bounds))
+    stops = np.concatenate((bounds, [len(is_feature)]))
+    pieces = []
+    feature_start = 0
+    for start, stop in zip(starts, stops, strict=True):
+        if is_feature[start]:
+            feature_stop = feature_start + stop - start
+            pieces.append(
+                pd.DataFrame(
+                    feature_block[:, feature_start:feature_stop],
+                    columns=data.columns[start:stop],
+                    index=data.index,
+                    copy=False,
+                )
+            )
+            feature_start = feature_stop
+        else:
+            pieces.append(data.iloc[:, start:stop].copy())
+    return pd.concat(pieces, axis=1, copy=False)
+
+
+def _scale_columns(
+    data: pd.DataFrame,
+    cols_to_scale: list[str],
+    *,
+    copy: bool,
+    dtype: "DTypeLike" = np.float64,
+    use_sklearn: bool = False,
+    cache: "StatsCache | None" = None,
+) -> pd.DataFrame:
+    """Standardize ``cols_to_scale`` and leave all other columns untouched.
+
+    With ``copy=True`` the whole frame is not deep-copied up front: the
+    metadata columns are copied once and combined with the scaled feature
+    block. Under pandas' copy-on-write mode they are shared with ``data``
+    instead, since writes to the result cannot reach it. Column statistics
+    are always accumulated in float64, so a float32 ``dtype`` halves the
+    memory traffic without losing the mean.
+
+    Args:
+    ----
+        data: Input DataFrame
+        cols_to_scale: Feature columns to standardize
+        copy: Whether to return a new DataFrame instead of scaling in place
+        dtype: Floating dtype of the scaled feature columns
+        use_sklearn: Scale with ``StandardScaler`` instead of the NumPy kernel
+        cache: Fitted statistics to reuse for the same frame and columns
+
+    Returns:
+    -------
+        DataFrame with the feature columns scaled
+
+    """
+    # Cache entries refer to the caller's frame, not the shallow copy
+    source = data
+    shallow_copy = copy and _copy_on_write_enabled()
+    if shallow_copy:
+        data = data.copy(deep=False)
+    if not cols_to_scale:
+        return data.copy() if copy and not shallow_copy else data
+
+    if cache is not None:
+        _prune_stats_cache(cache)
+        if not copy:
+            # Scaling in place changes the frame the statistics were fitted on
+            cache.pop((id(source), tuple(cols_to_scale)), None)
+            cache = None
+
+    fast_path = not copy and not use_sklearn
+    if fast_path and _scale_inplace_fast(data, cols_to_scale, dtype):
+        return data
+
+    # Without copy-on-write the column selection is already a private copy;
+    # with it, to_numpy may return a read-only view of the caller's block
+    feature_block = data[cols_to_scale].to_numpy(
+        dtype=dtype, copy=_copy_on_write_enabled()
+    )
+    if use_sklearn:
+        scaler = StandardScaler(copy=False, with_mean=True, with_std=True)
+        feature_block = scaler.fit_transform(feature_block)
+    elif cache is None:
+        _standardize_inplace(feature_block)
+    else:
+        # id() values are reused once a frame is garbage collected, so an
+        # entry only counts as a hit if it still refers to this very frame,
+        # and only if the frame's feature values have not changed since
+        key = (id(source), tuple(cols_to_scale))
+        fingerprint = _block_fingerprint(feature_block)
+        entry = cache.get(key)
+        if entry is None or entry[0]() is not source or entry[1] != fingerprint:
+            entry = (weakref.ref(source), fingerprint, *_fit_stats(feature_block))
+            cache[key] = entry
+        _apply_stats(feature_block, entry[2], entry[3])
+
+    if copy and not shallow_copy:
+        # Without copy-on-write a shallow copy would let writes to the
+        # result's metadata columns reach the caller's frame
+        return _combine_in_column_order(data, feature_block, cols_to_scale)
+
+    # Replaces the feature columns rather than writing into their storage,
+    # so a shallow copy never touches the caller's data
+    data[cols_to_scale] = feature_block
+    return data
+
 
 def scale_metabolomics(
     data: pd.DataFrame,
     exclude_cols: list[str] | None = None,
     *,  # Force copy as keyword-only argument
     copy: bool = True,
+    dtype: "DTypeLike" = np.float64,
+    use_sklearn: bool = False,
+    cache: "StatsCache | None" = None,
 ) -> pd.DataFrame:
-    """Scale metabolomics data using StandardScaler while preserving metadata.
+    """Scale metabolomics data to zero mean and unit variance, preserving metadata.
 
     Args:
     ----
         data: Input DataFrame with metabolomics data
         exclude_cols: Columns to exclude from scaling (e.g. metadata)
         copy: Whether to copy the data before scaling
+        dtype: Floating dtype of the scaled features (e.g. ``np.float32``)
+        use_sklearn: Scale with sklearn's StandardScaler instead of NumPy
+        cache: Dict of fitted statistics to reuse across calls on the same
+            DataFrame, refitted when its features change (ignored when
+            ``use_sklearn`` is True or ``copy`` is False)
 
     Returns:
     -------
@@ -26,21 +442,18 @@ def scale_metabolomics(
     if exclude_cols is None:
         exclude_cols = ["shannon", "PD_whole_tree", "chao1", "BMI", "Age", "sex"]
 
-    # Create copy if requested
-    if copy:
-        data = data.copy()
-
     # Separate features to scale from excluded columns
-    cols_to_scale = [col for col in data.columns if col not in exclude_cols]
+    exclude_set = frozenset(exclude_cols)
+    cols_to_scale = [col for col in data.columns if col not in exclude_set]
 
-    # Initialize and fit scaler
-    scaler = StandardScaler(copy=True, with_mean=True, with_std=True)
-
-    # Scale features
-    if cols_to_scale:
-        data[cols_to_scale] = scaler.fit_transform(data[cols_to_scale])
-
-    return data
+    return _scale_columns(
+        data,
+        cols_to_scale,
+        copy=copy,
+        dtype=dtype,
+        use_sklearn=use_sklearn,
+        cache=cache,
+    )
 
 
 def scale_proteomics(
@@ -48,6 +461,9 @@ def scale_proteomics(
     metadata_cols: list[str] | None = None,
     *,  # Force copy as keyword-only argument
     copy: bool = True,
+    dtype: "DTypeLike" = np.float64,
+    use_sklearn: bool = False,
+    cache: "StatsCache | None" = None,
 ) -> pd.DataFrame:
     """Scale proteomics data while preserving metadata columns.
 
@@ -56,6 +472,11 @@ def scale_proteomics(
         data: Input DataFrame with proteomics data
         metadata_cols: Metadata columns to exclude from scaling
         copy: Whether to copy the data before scaling
+        dtype: Floating dtype of the scaled features (e.g. ``np.float32``)
+        use_sklearn: Scale with sklearn's StandardScaler instead of NumPy
+        cache: Dict of fitted statistics to reuse across calls on the same
+            DataFrame, refitted when its features change (ignored when
+            ``use_sklearn`` is True or ``copy`` is False)
 
     Returns:
     -------
@@ -65,18 +486,18 @@ def scale_proteomics(
     if metadata_cols is None:
         metadata_cols = ["shannon", "sex", "age"]
 
-    if copy:
-        data = data.copy()
-
     # Get protein columns
-    protein_cols = [col for col in data.columns if col not in metadata_cols]
+    metadata_set = frozenset(metadata_cols)
+    protein_cols = [col for col in data.columns if col not in metadata_set]
 
-    # Scale protein data
-    scaler = StandardScaler(copy=True, with_mean=True, with_std=True)
-    if protein_cols:
-        data[protein_cols] = scaler.fit_transform(data[protein_cols])
-
-    return data
+    return _scale_columns(
+        data,
+        protein_cols,
+        copy=copy,
+        dtype=dtype,
+        use_sklearn=use_sklearn,
+        cache=cache,
+    )
 
 
 def scale_clinical_labs(
@@ -84,6 +505,9 @@ def scale_clinical_labs(
     metadata_cols: list[str] | None = None,
     *,  # Force copy as keyword-only argument
     copy: bool = True,
+    dtype: "DTypeLike" = np.float64,
+    use_sklearn: bool = False,
+    cache: "StatsCache | None" = None,
 ) -> pd.DataFrame:
     """Scale clinical laboratory data while preserving metadata.
 
@@ -92,6 +516,11 @@ def scale_clinical_labs(
         data: Input DataFrame with clinical lab data
         metadata_cols: Metadata columns to exclude from scaling
         copy: Whether to copy the data before scaling
+        dtype: Floating dtype of the scaled features (e.g. ``np.float32``)
+        use_sklearn: Scale with sklearn's StandardScaler instead of NumPy
+        cache: Dict of fitted statistics to reuse across calls on the same
+            DataFrame, refitted when its features change (ignored when
+            ``use_sklearn`` is True or ``copy`` is False)
 
     Returns:
     -------
@@ -101,18 +530,120 @@ def scale_clinical_labs(
     if metadata_cols is None:
         metadata_cols = ["shannon"]
 
-    if copy:
-        data = data.copy()
-
     # Get clinical lab columns
-    lab_cols = [col for col in data.columns if col not in metadata_cols]
+    metadata_set = frozenset(metadata_cols)
+    lab_cols = [col for col in data.columns if col not in metadata_set]
 
-    # Scale lab data
-    scaler = StandardScaler(copy=True, with_mean=True, with_std=True)
-    if lab_cols:
-        data[lab_cols] = scaler.fit_transform(data[lab_cols])
+    return _scale_columns(
+        data,
+        lab_cols,
+        copy=copy,
+        dtype=dtype,
+        use_sklearn=use_sklearn,
+        cache=cache,
+    )
 
-    return data
+
+def _suffix_overlapping_columns(dfs: list[pd.DataFrame]) -> list[list[str]]:
+    """Reproduce the column names of chained pairwise index merges.
+
+    Merging ``dfs`` left to right with ``DataFrame.merge`` suffixes columns
+    present on both sides with ``_x``/``_y``. Computing those names up front
+    lets the frames be aligned with one ``pd.concat`` instead.
+
+    Args:
+    ----
+        dfs: DataFrames in merge order
+
+    Returns:
+    -------
+        Column names for each DataFrame after suffixing
+
+    """
+    names = [list(dfs[0].columns)]
+    for df in dfs[1:]:
+        merged_cols = {col for cols in names for col in cols}
+        overlap = merged_cols.intersection(df.columns)
+        names = [
+            [f"{col}_x" if col in overlap else col for col in cols] for cols in names
+        ]
+        names.append([f"{col}_y" if col in overlap else col for col in df.columns])
+    return names
+
+
+def _merge_on_index(dfs: list[pd.DataFrame], join: str) -> pd.DataFrame:
+    """Merge DataFrames on their index one pair at a time.
+
+    Args:
+    ----
+        dfs: DataFrames in merge order
+        join: How to join DataFrames, as accepted by ``DataFrame.merge``
+
+    Returns:
+    -------
+        Merged DataFrame
+
+    """
+    merged_data = dfs[0]
+    for next_data in dfs[1:]:
+        merged_data = merged_data.merge(
+            next_data,
+            left_index=True,
+            right_index=True,
+            how=join,
+        )
+    return merged_data
+
+
+def _join_with_polars(
+    dfs: list[pd.DataFrame],
+    columns: list[list[str]],
+    join: str,
+) -> pd.DataFrame:
+    """Join DataFrames on their index with Polars' multi-threaded joins.
+
+    Rows are ordered like ``pd.concat``: by the first frame for inner joins
+    and by sorted index for outer joins.
+
+    Args:
+    ----
+        dfs: DataFrames sharing the same index type
+        columns: Column names to use for each DataFrame
+        join: How to join DataFrames ('inner' or 'outer')
+
+    Returns:
+    -------
+        Joined DataFrame
+
+    Raises:
+    ------
+        ImportError: If polars is not installed
+
+    """
+    try:
+        import polars as pl
+    except ImportError as err:
+        msg = "engine='polars' requires the polars package"
+        raise ImportError(msg) from err
+
+    key = "__index__"
+    order = "__order__"
+    frames = [
+        pl.from_pandas(
+            df.set_axis(cols, axis=1, copy=False).rename_axis(key).reset_index()
+        ).lazy()
+        for df, cols in zip(dfs, columns, strict=True)
+    ]
+
+    joined = frames[0].with_row_index(order)
+    for frame in frames[1:]:
+        if join == "inner":
+            joined = joined.join(frame, on=key, how="inner")
+        else:
+            joined = joined.join(frame, on=key, how="full", coalesce=True)
+    joined = joined.sort(order if join == "inner" else key).drop(order)
+
+    return joined.collect().to_pandas().set_index(key).rename_axis(dfs[0].index.name)
 
 
 def scale_and_combine_omics(
@@ -120,45 +651,70 @@ def scale_and_combine_omics(
     proteomics_data: pd.DataFrame | None = None,
     clinical_data: pd.DataFrame | None = None,
     join: str = "inner",
+    engine: str = "pandas",
+    cache: "StatsCache | None" = None,
 ) -> pd.DataFrame:
     """Scale and combine multiple omics data types.
 
+    Inner and outer joins of uniquely indexed frames are aligned in a single
+    pass with the chosen engine. Left and right joins, and frames with
+    duplicated index labels, are merged pairwise with ``DataFrame.merge``.
+
     Args:
     ----
         metabolomics_data: Metabolomics DataFrame
         proteomics_data: Optional proteomics DataFrame
         clinical_data: Optional clinical labs DataFrame
-        join: How to join DataFrames ('inner' or 'outer')
+        join: How to join DataFrames ('inner', 'outer', 'left' or 'right')
+        engine: Library used to join the scaled DataFrames ('pandas' or
+            'polars'); 'polars' requires the optional polars package
+        cache: Dict of fitted statistics reused when the same DataFrames are
+            combined repeatedly, e.g. across cross-validation loops
 
     Returns:
     -------
         Combined scaled DataFrame
 
+    Raises:
+    ------
+        ValueError: If join or engine is not supported
+
     """
+    if engine not in ("pandas", "polars"):
+        msg = f"Unsupported engine: {engine}"
+        raise ValueError(msg)
+
     # Scale each datatype
-    scaled_metabolomics = scale_metabolomics(metabolomics_data)
+    scaled_metabolomics = scale_metabolomics(metabolomics_data, cache=cache)
 
     dfs_to_merge = [scaled_metabolomics]
 
     if proteomics_data is not None:
-        scaled_proteomics = scale_proteomics(proteomics_data)
+        scaled_proteomics = scale_proteomics(proteomics_data, cache=cache)
         dfs_to_merge.append(scaled_proteomics)
 
     if clinical_data is not None:
-        scaled_clinical = scale_clinical_labs(clinical_data)
+        scaled_clinical = scale_clinical_labs(clinical_data, cache=cache)
         dfs_to_merge.append(scaled_clinical)
 
-    # Merge all available data
     if len(dfs_to_merge) > 1:
-        merged_data = dfs_to_merge[0]
-        for next_data in dfs_to_merge[1:]:
-            merged_data = merged_data.merge(
-                next_data,
-                left_index=True,
-                right_index=True,
-                how=join,
-            )
-        return merged_data
+        # Left and right joins, and duplicated index labels (which
+        # multiply matching rows), keep the pairwise merges
+        if join not in ("inner", "outer") or not all(
+            df.index.is_unique for df in dfs_to_merge
+        ):
+            return _merge_on_index(dfs_to_merge, join)
+
+        # Align all available data on the index in a single pass
+        merged_columns = _suffix_overlapping_columns(dfs_to_merge)
+        if engine == "polars":
+            return _join_with_polars(dfs_to_merge, merged_columns, join)
+
+        renamed = [
+            df.set_axis(columns, axis=1, copy=False)
+            for df, columns in zip(dfs_to_merge, merged_columns, strict=True)
+        ]
+        return pd.concat(renamed, axis=1, join=join, sort=join == "outer", copy=False)
 
     return dfs_to_merge[0]
 
@@ -182,4 +738,5 @@ def get_scaled_feature_names(
     if exclude_cols is None:
         exclude_cols = ["shannon", "PD_whole_tree", "chao1", "BMI", "Age", "sex"]
 
-    return [col for col in data.columns if col not in exclude_cols]
+    exclude_set = frozenset(exclude_cols)
+    return [col for col in data.columns if col not in exclude_set]
@@ -1,7 +1,10 @@
 """Tests for data cleaning functions."""
 
+import warnings
+
 import pandas as pd
 import pytest
+from gutmetrics.preprocessing import cleaning
 from gutmetrics.preprocessing.cleaning import (
     clean_metadata,
     remove_outliers,
@@ -143,3 +146,93 @@ def test_remove_outliers_all_same() -> None:
     result = remove_outliers(test_data, "value", n_std=STD_THRESHOLD)
     assert len(result) == 3
     assert (result["value"] == 1.0).all()
+
+
+def test_remove_outliers_drops_missing() -> None:
+    """Test remove_outliers ignores NaNs for the bounds and drops those rows."""
+    test_data = pd.DataFrame({"value": [1.0, 2.0, float("nan"), 2.5, 3.0, 100.0]})
+    result = remove_outliers(test_data, "value", n_std=STD_THRESHOLD)
+    assert result["value"].tolist() == [1.0, 2.0, 2.5, 3.0]
+
+
+def test_validate_microbiome_not_normalized() -> None:
+    """Test validate_microbiome_data with OTU rows not summing to 1."""
+    test_data = pd.DataFrame(
+        {
+            "bacteria_1": [0.5, 0.6],
+            "Bacteria_2": [0.5, 0.6],
+            "total_reads": [MIN_READS, MIN_READS],
+        }
+    )
+    with pytest.raises(ValueError, match="not normalized"):
+        validate_microbiome_data(test_data)
+
+
+def test_validate_microbiome_no_otu_columns() -> None:
+    """Test validate_microbiome_data without bacterial OTU columns."""
+    test_data = pd.DataFrame({"total_reads": [MIN_READS, MIN_READS]})
+    with pytest.raises(ValueError, match="No bacterial OTU columns found"):
+        validate_microbiome_data(test_data)
+
+
+def test_standardize_index_leaves_input_unchanged(sample_data: pd.DataFrame) -> None:
+    """Test standardize_index does not modify the input DataFrame."""
+    original = sample_data.copy()
+    result = standardize_index(sample_data)
+    result["value"] = 0.0
+    pd.testing.assert_frame_equal(sample_data, original)
+
+
+def test_validate_metabolomics_non_numeric() -> None:
+    """Test validate_metabolomics_data with non-numeric metabolite columns."""
+    test_data = pd.DataFrame(
+        {
+            "shannon": [1.0, 2.0],
+            "PD_whole_tree": [0.5, 0.6],
+            "chao1": [100.0, 120.0],
+            "metabolite1": pd.Series([0.1, 0.2], dtype="float32"),
+            "metabolite2": ["low", "high"],
+        },
+    )
+    with pytest.raises(
+        ValueError, match="Non-numeric data found in columns: metabolite2$"
+    ):
+        validate_metabolomics_data(test_data)
+
+
+def test_validate_microbiome_missing_abundance() -> None:
+    """Test validate_microbiome_data skips missing abundances in row sums."""
+    test_data = pd.DataFrame(
+        {
+            "bacteria_1": [0.5, float("nan")],
+            "bacteria_2": [0.5, 1.0],
+        }
+    )
+    assert validate_microbiome_data(test_data)
+
+
+def test_validate_microbiome_chunked(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test validate_microbiome_data when rows span several chunks."""
+    monkeypatch.setattr(cleaning, "_VALIDATION_CHUNK_SIZE", 2)
+    test_data = pd.DataFrame(
+        {
+            "bacteria_1": [0.5, 0.6, 0.1, 0.3, 0.9],
+            "bacteria_2": [0.5, 0.4, 0.9, 0.7, 0.1],
+        }
+    )
+    assert validate_microbiome_data(test_data)
+
+    test_data.loc[4, "bacteria_2"] = 0.2
+    with pytest.raises(ValueError, match="not normalized"):
+        validate_microbiome_data(test_data)
+
+
+@pytest.mark.parametrize("values", [[], [float("nan"), float("nan")]])
+def test_remove_outliers_no_values(values: list[float]) -> None:
+    """Test remove_outliers on empty and all-NaN columns."""
+    test_data = pd.DataFrame({"value": values}, dtype="float64")
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        result = remove_outliers(test_data, "value", n_std=STD_THRESHOLD)
+    assert result.empty
+    assert list(result.columns) == ["value"]
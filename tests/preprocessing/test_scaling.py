@@ -1,9 +1,12 @@
 """Unit tests for scaling module."""
 
+import tracemalloc
+
 import numpy as np
 import pandas as pd
 import pytest
 
+from gutmetrics.preprocessing import scaling
 from gutmetrics.preprocessing.scaling import (
     scale_metabolomics,
     scale_proteomics,
@@ -175,3 +178,294 @@ def test_get_scaled_feature_names(sample_metabolomics_data: pd.DataFrame) -> Non
         exclude_cols=["shannon", "met1"],
     )
     assert set(custom_features) == {"met2", "BMI", "Age", "sex"}
+
+
+def test_scale_metabolomics_preserves_layout(
+    sample_metabolomics_data: pd.DataFrame,
+) -> None:
+    """Test that scaling keeps column order and index of the input."""
+    scaled = scale_metabolomics(sample_metabolomics_data)
+    assert list(scaled.columns) == list(sample_metabolomics_data.columns)
+    pd.testing.assert_index_equal(scaled.index, sample_metabolomics_data.index)
+
+
+def test_scale_metabolomics_matches_sklearn(
+    sample_metabolomics_data: pd.DataFrame,
+) -> None:
+    """Test that the NumPy kernel matches the StandardScaler path."""
+    scaled = scale_metabolomics(sample_metabolomics_data)
+    scaled_sklearn = scale_metabolomics(sample_metabolomics_data, use_sklearn=True)
+    pd.testing.assert_frame_equal(scaled, scaled_sklearn)
+
+    # Missing values are ignored when fitting and kept in the output
+    with_nan = sample_metabolomics_data.copy()
+    with_nan.loc[["p1", "p5"], "met1"] = np.nan
+    scaled = scale_metabolomics(with_nan)
+    assert scaled["met1"].isna().sum() == 2
+    pd.testing.assert_frame_equal(
+        scaled, scale_metabolomics(with_nan, use_sklearn=True)
+    )
+
+    # Near constant features are centered but not blown up by rounding noise
+    near_constant = sample_metabolomics_data.assign(met1=0.1)
+    scaled = scale_metabolomics(near_constant)
+    assert np.abs(scaled["met1"]).max() < 1e-10
+    pd.testing.assert_frame_equal(
+        scaled, scale_metabolomics(near_constant, use_sklearn=True)
+    )
+
+
+def test_scale_clinical_labs_constant_column() -> None:
+    """Test that zero-variance features are centered but not divided by zero."""
+    data = pd.DataFrame({"lab1": [5.0, 5.0, 5.0], "shannon": [0.5, 0.6, 0.7]})
+    scaled = scale_clinical_labs(data)
+    assert (scaled["lab1"] == 0.0).all()
+
+
+def test_scale_proteomics_float32(sample_proteomics_data: pd.DataFrame) -> None:
+    """Test scaling proteomics features into a float32 block."""
+    scaled = scale_proteomics(sample_proteomics_data, dtype=np.float32)
+
+    assert scaled["prot1"].dtype == np.float32
+    assert scaled["shannon"].dtype == np.float64
+    assert np.abs(scaled["prot1"].to_numpy(dtype=np.float64).mean()) < 1e-6
+    assert np.abs(scaled["prot1"].to_numpy(dtype=np.float64).std() - 1) < 1e-6
+
+
+def test_scale_and_combine_omics_shared_columns(
+    sample_metabolomics_data: pd.DataFrame,
+    sample_proteomics_data: pd.DataFrame,
+    sample_clinical_data: pd.DataFrame,
+) -> None:
+    """Test that columns shared between inputs are suffixed like a merge."""
+    combined = scale_and_combine_omics(
+        sample_metabolomics_data,
+        sample_proteomics_data,
+        sample_clinical_data,
+    )
+    assert {"shannon_x", "shannon_y", "shannon", "sex_x", "sex_y"} <= set(
+        combined.columns
+    )
+    assert combined.columns.is_unique
+
+
+def test_scale_metabolomics_numba_kernel(
+    sample_metabolomics_data: pd.DataFrame,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that the numba kernel matches the NumPy kernel."""
+    pytest.importorskip("numba")
+    data = sample_metabolomics_data.assign(met2=0.1)
+    data.loc[["p1", "p5"], "met1"] = np.nan
+    expected = scale_metabolomics(data)
+
+    monkeypatch.setattr(scaling, "_NUMBA_MIN_SIZE", 0)
+    scaled = scale_metabolomics(data)
+    pd.testing.assert_frame_equal(scaled, expected)
+
+
+@pytest.mark.parametrize("join", ["inner", "outer"])
+def test_scale_and_combine_omics_polars(
+    sample_metabolomics_data: pd.DataFrame,
+    sample_proteomics_data: pd.DataFrame,
+    sample_clinical_data: pd.DataFrame,
+    join: str,
+) -> None:
+    """Test that the Polars engine matches the pandas engine."""
+    pytest.importorskip("polars")
+    proteomics = sample_proteomics_data.iloc[10:]
+    clinical = sample_clinical_data.iloc[::-1]
+
+    expected = scale_and_combine_omics(
+        sample_metabolomics_data, proteomics, clinical, join=join
+    )
+    combined = scale_and_combine_omics(
+        sample_metabolomics_data, proteomics, clinical, join=join, engine="polars"
+    )
+    pd.testing.assert_frame_equal(combined, expected)
+
+
+@pytest.mark.parametrize("engine", ["pandas", "polars"])
+def test_scale_and_combine_omics_merge_fallback(
+    sample_metabolomics_data: pd.DataFrame,
+    sample_proteomics_data: pd.DataFrame,
+    engine: str,
+) -> None:
+    """Test that duplicated indexes and left joins are merged pairwise."""
+    if engine == "polars":
+        pytest.importorskip("polars")
+    metabolomics = sample_metabolomics_data.iloc[:3].set_axis(["a", "a", "b"])
+    proteomics = sample_proteomics_data.iloc[:2].set_axis(["a", "b"])
+    combined = scale_and_combine_omics(metabolomics, proteomics, engine=engine)
+    assert combined.shape == (3, 11)
+    assert list(combined.index) == ["a", "a", "b"]
+
+    proteomics = sample_proteomics_data.iloc[10:]
+    combined = scale_and_combine_omics(
+        sample_metabolomics_data, proteomics, join="left", engine=engine
+    )
+    expected = scale_metabolomics(sample_metabolomics_data).merge(
+        scale_proteomics(proteomics), left_index=True, right_index=True, how="left"
+    )
+    pd.testing.assert_frame_equal(combined, expected)
+
+
+def test_scale_and_combine_omics_invalid_engine(
+    sample_metabolomics_data: pd.DataFrame,
+) -> None:
+    """Test scale_and_combine_omics with an unsupported engine."""
+    with pytest.raises(ValueError, match="Unsupported engine: dask"):
+        scale_and_combine_omics(sample_metabolomics_data, engine="dask")
+
+
+def test_scale_and_combine_omics_cache(
+    sample_metabolomics_data: pd.DataFrame,
+    sample_proteomics_data: pd.DataFrame,
+    sample_clinical_data: pd.DataFrame,
+) -> None:
+    """Test that fitted statistics are cached and reused across calls."""
+    cache: dict = {}
+    first = scale_and_combine_omics(
+        sample_metabolomics_data,
+        sample_proteomics_data,
+        sample_clinical_data,
+        cache=cache,
+    )
+    assert len(cache) == 3
+
+    second = scale_and_combine_omics(
+        sample_metabolomics_data,
+        sample_proteomics_data,
+        sample_clinical_data,
+        cache=cache,
+    )
+    assert len(cache) == 3
+    pd.testing.assert_frame_equal(first, second)
+    pd.testing.assert_frame_equal(
+        first,
+        scale_and_combine_omics(
+            sample_metabolomics_data, sample_proteomics_data, sample_clinical_data
+        ),
+    )
+
+
+def test_scale_proteomics_inplace_block(sample_proteomics_data: pd.DataFrame) -> None:
+    """Test in-place scaling directly on pandas' float block."""
+    expected = scale_proteomics(sample_proteomics_data)
+    data = sample_proteomics_data.copy()
+    assert scaling._scale_inplace_fast(data.copy(), ["prot1", "prot2"], np.float64)
+
+    scaled = scale_proteomics(data, copy=False)
+    assert scaled is data
+    pd.testing.assert_frame_equal(scaled, expected)
+
+
+def test_scale_metabolomics_cache_temporary_frames(
+    sample_metabolomics_data: pd.DataFrame,
+) -> None:
+    """Test that cached statistics are not reused for a different frame."""
+    data = sample_metabolomics_data.assign(
+        met1=np.arange(len(sample_metabolomics_data), dtype=np.float64)
+    )
+    cache: dict = {}
+    for start in range(0, len(data), 20):
+        fold = scale_metabolomics(data.iloc[start : start + 20].copy(), cache=cache)
+        assert np.abs(fold["met1"].mean()) < 1e-10
+        assert np.abs(fold["met1"].std(ddof=0) - 1) < 1e-10
+
+    # Simulate CPython reusing a collected fold's id() for the next fold
+    first = data.iloc[:20].copy()
+    second = data.iloc[20:40].copy()
+    cache = {}
+    scale_metabolomics(first, cache=cache)
+    (((_, columns), entry),) = cache.items()
+    cache = {(id(second), columns): entry}
+    scaled = scale_metabolomics(second, cache=cache)
+    assert np.abs(scaled["met1"].mean()) < 1e-10
+
+
+def test_scale_proteomics_cache_modified_frame(
+    sample_proteomics_data: pd.DataFrame,
+) -> None:
+    """Test that cached statistics are refitted after the frame changes."""
+    cache: dict = {}
+    data = sample_proteomics_data.copy()
+    for _ in range(2):
+        scaled = scale_proteomics(data, copy=False, cache=cache)
+        assert np.abs(scaled["prot1"].mean()) < 1e-10
+        assert np.abs(scaled["prot1"].std(ddof=0) - 1) < 1e-10
+    assert not cache
+
+    data = sample_proteomics_data.copy()
+    scale_proteomics(data, cache=cache)
+    data.loc["p0", "prot1"] = 1e6
+    scaled = scale_proteomics(data, cache=cache)
+    assert np.abs(scaled["prot1"].mean()) < 1e-10
+    assert len(cache) == 1
+
+    # Entries of collected frames are dropped on the next call
+    del data
+    scale_proteomics(sample_proteomics_data, cache=cache)
+    assert len(cache) == 1
+
+
+@pytest.mark.parametrize("copy_on_write", [False, True])
+def test_scale_metabolomics_result_is_independent(
+    sample_metabolomics_data: pd.DataFrame,
+    copy_on_write: bool,
+) -> None:
+    """Test that writing to the copied result leaves the input unchanged."""
+    original = sample_metabolomics_data.copy()
+    with pd.option_context("mode.copy_on_write", copy_on_write):
+        scaled = scale_metabolomics(sample_metabolomics_data)
+        scaled.loc["p0", "shannon"] = 99.0
+        scaled.loc["p0", "sex"] = 99
+    pd.testing.assert_frame_equal(sample_metabolomics_data, original)
+    assert list(scaled.columns) == list(original.columns)
+
+
+def test_scale_proteomics_inplace_leaves_source_array() -> None:
+    """Test copy=False never writes into an ndarray the frame was built from."""
+    values = np.random.default_rng(0).normal(100, 20, (50, 3))
+    original = values.copy()
+    data = pd.DataFrame(values, columns=["prot1", "prot2", "prot3"])
+
+    scaled = scale_proteomics(data, copy=False)
+
+    np.testing.assert_array_equal(values, original)
+    assert np.abs(scaled["prot1"].mean()) < 1e-10
+
+
+@pytest.mark.parametrize("max_inserted", [50, 0])
+def test_combine_in_column_order(
+    max_inserted: int,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that interleaved metadata columns are restored in their positions."""
+    monkeypatch.setattr(scaling, "_MAX_INSERTED_COLUMNS", max_inserted)
+    rng = np.random.default_rng(0)
+    n_samples, n_features = 5_000, 100
+    feature_cols = [f"met{i}" for i in range(n_features)]
+    data = pd.DataFrame(rng.normal(size=(n_samples, n_features)), columns=feature_cols)
+    data.insert(40, "sex", rng.integers(0, 2, n_samples))
+    data.insert(0, "participant_id", np.arange(n_samples))
+    data["Age"] = rng.normal(40, 10, n_samples)
+    # Consolidate the blocks now so pandas does not do it while being traced
+    data = data.copy()
+    feature_block = np.asfortranarray(rng.normal(size=(n_samples, n_features)))
+
+    tracemalloc.start()
+    try:
+        combined = scaling._combine_in_column_order(data, feature_block, feature_cols)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert list(combined.columns) == list(data.columns)
+    np.testing.assert_array_equal(combined[feature_cols].to_numpy(), feature_block)
+    pd.testing.assert_series_equal(combined["sex"], data["sex"])
+    assert not np.shares_memory(combined["sex"].to_numpy(), data["sex"].to_numpy())
+    if max_inserted:
+        # The feature block is used as is instead of being copied again
+        assert peak < feature_block.nbytes / 4
+        assert np.shares_memory(combined["met50"].to_numpy(), feature_block)